@@ -0,0 +1,357 @@
+import json
+import socket
+import struct
+import sys
+import time
+import argparse
+import itertools
+from pathlib import Path
+
+try:
+    import psutil  # only needed for --pid
+except ImportError:
+    psutil = None
+
+# ─────────────────────────────────────────────────────────────
+# Stream Connector - OSC Ingress Flood Test
+# Author: @Vixenlicious
+# Purpose:
+#   Local stress test for the OSC input listener.
+#   Floods the OSC in port with a mix of tracking noise (generated from
+#   nuclear.json / noisy_parameters.json) and parameters that no filter
+#   matches, then reports the achieved messages/sec.
+#
+# Measuring the app:
+#   Pass --pid <Stream Connector PID> (requires `pip install psutil`) to
+#   sample the app's CPU time over the flood window, including the
+#   busiest thread. Run once per configuration and compare. The
+#   sender's own CPU time is reported separately as sender_cpu_s.
+# ─────────────────────────────────────────────────────────────
+
+SAVED_DIR    = Path(__file__).resolve().parent.parent / "saved"
+ROUTING_FILE = SAVED_DIR / "config" / "routing" / "osc_config.json"
+NUCLEAR_FILE = SAVED_DIR / "config" / "filters" / "nuclear.json"
+NOISY_FILE   = SAVED_DIR / "config" / "filters" / "noisy_parameters.json"
+
+DEFAULT_ADDR = "127.0.0.1"
+DEFAULT_PORT = 9001
+
+PARAM_ROOT = "/avatar/parameters/"
+
+# Parameters that should survive filtering and reach the chain engine.
+# Checked against the loaded filters at startup; matches are dropped.
+SURVIVING_PARAMS = [
+    "/avatar/parameters/StreamConnector/Test",
+    "/avatar/parameters/StreamConnector/Intensity",
+    "/avatar/parameters/StreamConnector/Shock",
+    "/avatar/parameters/StreamConnector/Vibe",
+    "/avatar/parameters/StreamConnector/Chain",
+]
+
+# ─────────────────────────────────────────────────────────────
+# Logging
+# ─────────────────────────────────────────────────────────────
+
+def log(msg: str, level: str = "INFO", data=None):
+    prefix = f"[OSC-FLOOD][{level}]"
+    print(f"{prefix} {msg}")
+    if data is not None:
+        try:
+            print(f"{prefix} DATA: {json.dumps(data, indent=2)}")
+        except Exception:
+            print(f"{prefix} DATA: {data}")
+
+# ─────────────────────────────────────────────────────────────
+# Config Loading
+# ─────────────────────────────────────────────────────────────
+
+def _load_json(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        log(f"File not found: {path}", "WARN")
+    except Exception as e:
+        log(f"Failed reading {path}: {e}", "WARN")
+    return None
+
+
+def load_target() -> tuple[str, int]:
+    routing = _load_json(ROUTING_FILE) or {}
+    return (
+        routing.get("OSC_IN_ADDR", DEFAULT_ADDR),
+        int(routing.get("OSC_IN_PORT", DEFAULT_PORT)),
+    )
+
+
+def _patterns(entries: list) -> list[str]:
+    return [
+        e["pattern"] for e in entries
+        if isinstance(e, dict) and e.get("pattern")
+    ]
+
+
+def load_filters() -> dict[str, list[str]] | None:
+    nuclear = _load_json(NUCLEAR_FILE)
+    noisy = _load_json(NOISY_FILE)
+    if nuclear is None or noisy is None:
+        return None
+
+    return {
+        "tracking_prefixes":       nuclear.get("tracking_prefixes", []),
+        "tracking_fuzzy_suffixes": nuclear.get("tracking_fuzzy_suffixes", []),
+        "noisy_exact":             _patterns(noisy.get("noisy_exact", [])),
+        "noisy_prefixes":          _patterns(noisy.get("noisy_prefixes", [])),
+        "vrcfury_high_noise":      _patterns(noisy.get("vrcfury_high_noise", [])),
+    }
+
+
+def matches_filter(address: str, filters: dict[str, list[str]]) -> str | None:
+    """
+    Conservative match: returns the filter group an address could fall
+    into, erring on the side of "filtered" so survivors stay honest.
+    """
+    if address in filters["noisy_exact"]:
+        return "noisy_exact"
+    if any(address.startswith(p) for p in filters["tracking_prefixes"]):
+        return "tracking_prefixes"
+    if any(address.endswith(s) for s in filters["tracking_fuzzy_suffixes"]):
+        return "tracking_fuzzy_suffixes"
+    if any(p in address for p in filters["noisy_prefixes"]):
+        return "noisy_prefixes"
+    if any(p in address for p in filters["vrcfury_high_noise"]):
+        return "vrcfury_high_noise"
+    return None
+
+
+def build_noise_addresses(filters: dict[str, list[str]], suffix_cap: int = 0) -> list[str]:
+    """Generate full OSC addresses covering every filter group."""
+    suffixes = filters["tracking_fuzzy_suffixes"]
+    if suffix_cap > 0:
+        suffixes = suffixes[:suffix_cap]
+
+    addresses = list(filters["noisy_exact"])
+
+    # Face / body tracking: folder prefixes get every suffix, the rest
+    # (Viseme, Angular*, Velocity*, Gesture*, ...) are exact addresses
+    for prefix in filters["tracking_prefixes"]:
+        if prefix.endswith("/"):
+            addresses.extend(f"{prefix}{suffix}" for suffix in suffixes)
+        else:
+            addresses.append(prefix)
+
+    addresses.extend(f"{PARAM_ROOT}{suffix}" for suffix in suffixes)
+
+    for pattern in filters["noisy_prefixes"]:
+        address = pattern if pattern.startswith("/") else f"{PARAM_ROOT}{pattern}"
+        addresses.append(f"{address}Flood" if address.endswith("/") else address)
+
+    for pattern in filters["vrcfury_high_noise"]:
+        addresses.append(f"{PARAM_ROOT}VF1_{pattern}")
+
+    return list(dict.fromkeys(addresses))
+
+
+def check_survivors(filters: dict[str, list[str]]) -> list[str]:
+    survivors = []
+    for address in SURVIVING_PARAMS:
+        group = matches_filter(address, filters)
+        if group:
+            log(f"Dropping surviving param matched by {group}: {address}", "WARN")
+            continue
+        survivors.append(address)
+    return survivors
+
+# ─────────────────────────────────────────────────────────────
+# OSC Encoding
+# ─────────────────────────────────────────────────────────────
+
+def _osc_string(value: str) -> bytes:
+    raw = value.encode("utf-8") + b"\x00"
+    return raw + b"\x00" * (-len(raw) % 4)
+
+
+def encode_float_message(address: str, value: float) -> bytes:
+    return _osc_string(address) + _osc_string(",f") + struct.pack(">f", value)
+
+# ─────────────────────────────────────────────────────────────
+# Flood Runner
+# ─────────────────────────────────────────────────────────────
+
+def build_frames(noise: list[str], survivors: list[str],
+                 noise_ratio: float) -> list[tuple[bytes, bool]]:
+    """Pre-encode the frame cycle so the send loop does no encoding."""
+    frames = []
+    noise_per_cycle = round(noise_ratio * 100) if noise else 0
+    real_per_cycle = 100 - noise_per_cycle if survivors else 0
+
+    noise_iter = itertools.cycle(noise) if noise else None
+    real_iter = itertools.cycle(survivors) if survivors else None
+
+    # Enough cycles to touch every noise address at least once
+    cycles = -(-len(noise) // noise_per_cycle) if noise_per_cycle else 1
+
+    for step in range(cycles):
+        value = (step % 100) / 100.0
+        for _ in range(noise_per_cycle):
+            frames.append((encode_float_message(next(noise_iter), value), True))
+        for _ in range(real_per_cycle):
+            frames.append((encode_float_message(next(real_iter), value), False))
+
+    return frames
+
+
+def _sample_app(proc) -> dict | None:
+    if proc is None:
+        return None
+    times = proc.cpu_times()
+    return {
+        "cpu_s": times.user + times.system,
+        "threads": {t.id: t.user_time + t.system_time for t in proc.threads()},
+    }
+
+
+def _app_usage(before: dict | None, after: dict | None, elapsed: float) -> dict | None:
+    if before is None or after is None:
+        return None
+
+    cpu = after["cpu_s"] - before["cpu_s"]
+    deltas = {
+        tid: spent - before["threads"].get(tid, 0.0)
+        for tid, spent in after["threads"].items()
+    }
+    busiest_tid, busiest = max(deltas.items(), key=lambda kv: kv[1], default=(None, 0.0))
+
+    return {
+        "cpu_s": round(cpu, 3),
+        "cpu_percent_of_one_core": round(100 * cpu / elapsed, 1) if elapsed else 0,
+        "busiest_thread_id": busiest_tid,
+        "busiest_thread_cpu_s": round(busiest, 3),
+        "busiest_thread_percent": round(100 * busiest / elapsed, 1) if elapsed else 0,
+    }
+
+
+def flood(addr: tuple[str, int], frames: list[tuple[bytes, bool]],
+          duration: float, rate: int, proc=None) -> dict:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    sent = noise_sent = errors = 0
+    interval = 1.0 / rate if rate > 0 else 0.0
+    frame_iter = itertools.cycle(frames)
+
+    app_before = _sample_app(proc)
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    deadline = start + duration
+    next_send = start
+
+    try:
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+
+            if interval:
+                # Sleep rather than spin so the sender doesn't eat a core;
+                # oversleeping is caught up on by the following sends
+                wait = next_send - now
+                if wait > 0:
+                    time.sleep(wait)
+                    continue
+                next_send += interval
+
+            frame, is_noise = next(frame_iter)
+            try:
+                sock.sendto(frame, addr)
+            except OSError:
+                errors += 1
+                continue
+
+            sent += 1
+            noise_sent += is_noise
+    finally:
+        sock.close()
+
+    elapsed = time.perf_counter() - start
+    sender_cpu = time.process_time() - cpu_start
+    app_after = _sample_app(proc)
+
+    return {
+        "target": f"{addr[0]}:{addr[1]}",
+        "duration_s": round(elapsed, 3),
+        "sent": sent,
+        "noise_sent": noise_sent,
+        "surviving_sent": sent - noise_sent,
+        "send_errors": errors,
+        "messages_per_sec": round(sent / elapsed) if elapsed else 0,
+        "surviving_per_sec": round((sent - noise_sent) / elapsed) if elapsed else 0,
+        "sender_cpu_s": round(sender_cpu, 3),
+        "app": _app_usage(app_before, app_after, elapsed),
+    }
+
+# ─────────────────────────────────────────────────────────────
+# Runner
+# ─────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream Connector OSC ingress flood test")
+    parser.add_argument("--duration", type=float, default=10.0,
+                        help="Seconds to flood for (default: 10)")
+    parser.add_argument("--rate", type=int, default=0,
+                        help="Target messages/sec, 0 = as fast as possible")
+    parser.add_argument("--noise", type=float, default=0.95,
+                        help="Fraction of tracking noise in the stream (default: 0.95)")
+    parser.add_argument("--suffix-cap", type=int, default=0,
+                        help="Limit tracking suffixes used per prefix, 0 = all")
+    parser.add_argument("--pid", type=int, default=0,
+                        help="Stream Connector PID to sample CPU usage from (needs psutil)")
+    args = parser.parse_args()
+
+    proc = None
+    if args.pid:
+        if psutil is None:
+            log("--pid requires psutil (pip install psutil)", "ERROR")
+            sys.exit(1)
+        try:
+            proc = psutil.Process(args.pid)
+        except psutil.Error as e:
+            log(f"Cannot attach to PID {args.pid}: {e}", "ERROR")
+            sys.exit(1)
+
+    filters = load_filters()
+    if filters is None:
+        log(f"Filter files could not be loaded from {SAVED_DIR}, refusing to "
+            "flood without noise", "ERROR")
+        sys.exit(1)
+
+    addr = load_target()
+    noise = build_noise_addresses(filters, args.suffix_cap)
+    survivors = check_survivors(filters)
+    frames = build_frames(noise, survivors, max(0.0, min(args.noise, 1.0)))
+
+    if not frames:
+        log("No frames to send: no noise addresses or surviving params for "
+            f"--noise {args.noise}", "ERROR")
+        sys.exit(1)
+
+    log("Flood configured", "INFO", {
+        "target": f"{addr[0]}:{addr[1]}",
+        "noise_addresses": len(noise),
+        "surviving_addresses": len(survivors),
+        "frames_per_cycle": len(frames),
+        "duration_s": args.duration,
+        "rate": args.rate or "unlimited",
+        "app_pid": args.pid or None,
+    })
+
+    result = flood(addr, frames, args.duration, args.rate, proc)
+    log("Flood complete", "OK", result)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n[OSC-FLOOD] Interrupted.")
+    except Exception as e:
+        print("\n[OSC-FLOOD] Fatal error:", repr(e))
+        sys.exit(1)